@@ -1,22 +1,48 @@
 import builtins
+import importlib
+import operator
 
 from hyperparameter import param_scope
 
-from .datacollection import DataCollection, DataFrame
-from .execution.factory import ops
-from .execution.registry import register
 from .types import Document, Entity, State, dynamic_dispatch
 
 VERSION = "0.1.0"
 
-from_glob = DataCollection.from_glob
-from_pandas = DataFrame.from_pandas
-read_audio = DataCollection.read_audio
-read_camera = DataCollection.read_camera
-read_csv = DataFrame.read_csv
-read_json = DataFrame.read_json
-read_video = DataCollection.read_video
-read_zip = DataCollection.read_zip
+# Heavy symbols are imported on first access, see PEP 562.
+_LAZY = {
+    "DataCollection": (".datacollection", "DataCollection"),
+    "DataFrame": (".datacollection", "DataFrame"),
+    "ops": (".execution.factory", "ops"),
+    "register": (".execution.registry", "register"),
+    "from_glob": (".datacollection", "DataCollection.from_glob"),
+    "from_pandas": (".datacollection", "DataFrame.from_pandas"),
+    "read_audio": (".datacollection", "DataCollection.read_audio"),
+    "read_camera": (".datacollection", "DataCollection.read_camera"),
+    "read_csv": (".datacollection", "DataFrame.read_csv"),
+    "read_json": (".datacollection", "DataFrame.read_json"),
+    "read_video": (".datacollection", "DataCollection.read_video"),
+    "read_zip": (".datacollection", "DataCollection.read_zip"),
+}
+
+
+def __getattr__(name):
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    mod_name, attr = _LAZY[name]
+    value = operator.attrgetter(attr)(importlib.import_module(mod_name, __name__))
+    globals()[name] = value
+    return value
+
+
+def _single_column(key):
+    """Return a function that wraps a value into an Entity with a single column."""
+
+    def make(x):
+        entity = Entity.__new__(Entity)
+        entity.__dict__[key] = x
+        return entity
+
+    return make
 
 
 def _range(*args, **kwargs):  # pragma: no cover
@@ -36,12 +62,14 @@ def _range(*args, **kwargs):  # pragma: no cover
     [0, 1, 2, 3, 4]
     """
 
-    index = param_scope._index | None
+    # pylint: disable=import-outside-toplevel
+    from .datacollection import DataCollection, DataFrame
+
+    with param_scope() as ps:
+        index = ps._index | None
     if index is None:
         return DataCollection(builtins.range(*args, **kwargs))
-    return DataFrame(builtins.range(*args, **kwargs)).map(
-        lambda x: Entity(**{index: x})
-    )
+    return DataFrame(builtins.range(*args, **kwargs)).map(_single_column(index))
 
 
 range = dynamic_dispatch(_range)
@@ -90,7 +118,12 @@ def _api():
     >>> client.post('/app3', content='{"x": "3"}').text
     '{"y":"3 -> 3 => 3"}'
     """
-    return DataFrame.api(index=param_scope._index | None)
+    # pylint: disable=import-outside-toplevel
+    from .datacollection import DataFrame
+
+    with param_scope() as ps:
+        index = ps._index | None
+    return DataFrame.api(index=index)
 
 
 api = dynamic_dispatch(_api)
@@ -117,12 +150,17 @@ def _of(iterable):
     [<Entity dict_keys(['string', 'int'])>, <Entity dict_keys(['string', 'int'])>, <Entity dict_keys(['string', 'int'])>]
     """
 
-    index = param_scope._index | None
+    # pylint: disable=import-outside-toplevel
+    from .datacollection import DataCollection, DataFrame
+
+    with param_scope() as ps:
+        index = ps._index | None
     if index is None:
         return DataCollection(iterable)
     if isinstance(index, (list, tuple)):
-        return DataFrame(iterable).map(lambda x: Entity(**dict(zip(index, x))))
-    return DataFrame(iterable).map(lambda x: Entity(**{index: x}))
+        keys = tuple(index)
+        return DataFrame(iterable).map(lambda x: Entity.from_pairs(keys, x))
+    return DataFrame(iterable).map(_single_column(index))
 
 
 of = dynamic_dispatch(_of)
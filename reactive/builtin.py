@@ -1,3 +1,4 @@
+import functools
 from typing import Callable
 
 from .execution.registry import register
@@ -9,7 +10,11 @@ class runas_op:
     Convert a user-defined function as an operator and execute.
     Args:
         func (`Callable`):
-            The user-defined function.
+            The user-defined function. A numpy ufunc, or a `functools.partial`
+            of one, is applied to whole columns in column mode.
+        vectorized (`bool`):
+            Whether `func` takes whole column arrays in column mode, defaults
+            to False, which calls `func` once per row.
     Examples:
     >>> from reactive import DataCollection
     >>> from reactive import Entity
@@ -20,8 +25,38 @@ class runas_op:
     True
     """
 
-    def __init__(self, func: Callable):
+    def __init__(self, func: Callable, vectorized: bool = False):
         self._func = func
+        self._vectorized = vectorized
 
     def __call__(self, *args, **kws):
         return self._func(*args, **kws)
+
+    def __vcall__(self, *args):
+        """
+        Apply `func` to whole columns at once when it is a numpy ufunc or the
+        operator was created with `vectorized=True`, otherwise return
+        `NotImplemented` so the caller falls back to rows.
+
+        >>> import numpy as np
+        >>> runas_op(functools.partial(np.add, 1)).__vcall__(np.arange(3))
+        array([1, 2, 3])
+        >>> runas_op(lambda x: x + 1, vectorized=True).__vcall__(np.arange(3))
+        array([1, 2, 3])
+        >>> runas_op(lambda x: x + 1).__vcall__(np.arange(3))
+        NotImplemented
+        """
+        # pylint: disable=import-outside-toplevel
+        import numpy as np
+
+        if not all(isinstance(x, np.ndarray) for x in args):
+            return NotImplemented
+        if self._vectorized:
+            return self._func(*args)
+
+        func = self._func
+        while isinstance(func, functools.partial):
+            func = func.func
+        if isinstance(func, np.ufunc):
+            return self._func(*args)
+        return NotImplemented
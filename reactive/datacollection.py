@@ -1,12 +1,39 @@
-import inspect
+import functools
+import itertools
 import reprlib
+import sys
 from typing import Callable, Iterable, Iterator
 
-from hyperparameter import param_scope
-
 from .builtin import runas_op  # noqa: F401
 from .mixins import ColumnMixin, DataFrameMixin, DCMixins
-from .types import EntityView, Option, Some, dynamic_dispatch
+from .types import DynamicDispatch, EntityView, Option, Some
+
+
+@functools.lru_cache(maxsize=None)
+def _has_iterrows(cls):
+    """Whether instances of `cls` are iterated row by row, like pandas.DataFrame."""
+    return hasattr(cls, "iterrows")
+
+
+def _fuse_maps(fns):
+    """Compose the per-element steps of consecutive maps into one function.
+
+    >>> from reactive.types import Some
+    >>> _fuse_maps((lambda x: x + 1, lambda x: x * 2))(1)
+    4
+    >>> _fuse_maps((lambda x: x + 1, lambda x: x * 2))(Some(1))
+    Some(4)
+    """
+
+    def fused(x):
+        for fn in fns:
+            if isinstance(x, Option):
+                x = x.map(fn)
+            else:
+                x = fn(x)
+        return x
+
+    return fused
 
 
 class DataCollection(Iterable, DCMixins):
@@ -44,12 +71,16 @@ class DataCollection(Iterable, DCMixins):
         [4, 6, 8, 10]
     """
 
-    def __init__(self, iterable: Iterable) -> None:
+    def __init__(self, iterable: Iterable, parent=None) -> None:
+        # The mixins inherit their configuration from `_parent` during init only,
+        # it is dropped afterwards so that a pipeline does not retain its ancestors.
+        self._parent = parent
         super().__init__()
+        del self._parent
         self._iterable = iterable
 
     def __iter__(self) -> iter:
-        if hasattr(self._iterable, "iterrows"):
+        if _has_iterrows(type(self._iterable)):
             return (x[1] for x in self._iterable.iterrows())
         return iter(self._iterable)
 
@@ -57,14 +88,12 @@ class DataCollection(Iterable, DCMixins):
         if name.startswith("_"):
             return super().__getattribute__(name)
 
-        stacks = inspect.stack()[1][0]
-
-        @dynamic_dispatch
-        def wrapper(*arg, **kws):
-            op = self.resolve(stacks, *arg, **kws)
-            return self.map(op)
+        stacks = sys._getframe(1)
+        return DynamicDispatch(functools.partial(self._map_resolved, stacks), name)
 
-        return getattr(wrapper, name)
+    def _map_resolved(self, stack, *arg, **kws):
+        op = self.resolve(stack, *arg, **kws)
+        return self.map(op)
 
     def __getitem__(self, index) -> any:
         """Index based access of element in DataCollection.
@@ -153,13 +182,11 @@ class DataCollection(Iterable, DCMixins):
             [0, 1, 2, 3, 4, 0, ...]
         """
 
-        def inner():
-            for x in self:
-                yield x
-            for x in other:
-                yield x
-
-        return self._factory(inner())
+        other_iterable = getattr(other, "_iterable", None)
+        if type(self._iterable) is list and type(other_iterable) is list:
+            result = self._iterable + other_iterable
+            return self._factory(result, parent_stream=False)
+        return self._factory(itertools.chain(self, other))
 
     def __repr__(self) -> str:
         """String representation of the DataCollection
@@ -186,8 +213,8 @@ class DataCollection(Iterable, DCMixins):
     def _factory(self, iterable, parent_stream=True) -> "DataCollection":
         """Factory method for Creating new DataCollections.
 
-        This factory method has been wrapped into a `param_scope()` which contains the
-        parent DataCollection's information.
+        The new DataCollection inherits the configuration of this DataCollection,
+        which is passed to it as the parent.
 
         Args:
             iterable (Iterable): The data being encapsulated by the DataCollection
@@ -205,9 +232,7 @@ class DataCollection(Iterable, DCMixins):
                 if isinstance(iterable, Iterator):
                     iterable = list(iterable)
 
-        with param_scope() as ps:
-            ps.data_collection.parent = self
-            return DataCollection(iterable)
+        return DataCollection(iterable, parent=self)
 
     def map(self, *arg) -> "DataCollection":
         """Apply a function across all values in a DataCollection.
@@ -237,7 +262,7 @@ class DataCollection(Iterable, DCMixins):
         fn = arg[0]
 
         # smap map for stateful operator
-        if hasattr(fn, "is_stateful") and fn.is_stateful:
+        if getattr(fn, "is_stateful", False):
             return self.smap(fn)
 
         # pmap
@@ -247,8 +272,9 @@ class DataCollection(Iterable, DCMixins):
         if hasattr(self._iterable, "map"):
             return self._factory(self._iterable.map(fn))
 
-        if hasattr(self._iterable, "apply") and hasattr(fn, "__dataframe_apply__"):
-            return self._factory(fn.__dataframe_apply__(self._iterable))
+        dataframe_apply = getattr(fn, "__dataframe_apply__", None)
+        if dataframe_apply is not None and hasattr(self._iterable, "apply"):
+            return self._factory(dataframe_apply(self._iterable))
 
         # map
         def inner(x):
@@ -257,8 +283,22 @@ class DataCollection(Iterable, DCMixins):
             else:
                 return fn(x)
 
-        result = map(inner, self._iterable)
-        return self._factory(result)
+        # The result already has the parent's shape, skip the reshape in `_factory`.
+        if not self.is_stream:
+            result = [inner(x) for x in self._iterable]
+            return self._factory(result, parent_stream=False)
+
+        # Fuse consecutive maps on a stream into a single pass over the source.
+        fused = self.__dict__.get("_fused_map")
+        if fused is not None and fused[0] is self._iterable:
+            source, fns = fused[1], fused[2] + (fn,)
+            result = map(_fuse_maps(fns), source)
+        else:
+            source, fns = self._iterable, (fn,)
+            result = map(inner, source)
+        retval = self._factory(result, parent_stream=False)
+        retval._fused_map = (result, source, fns)
+        return retval
 
     def filter(self, fn: Callable, drop_empty=False) -> "DataCollection":
         """Filter the DataCollection data based on function.
@@ -285,10 +325,14 @@ class DataCollection(Iterable, DCMixins):
         if hasattr(self._iterable, "filter"):
             return self._factory(self._iterable.filter(fn))
 
-        if hasattr(self._iterable, "apply") and hasattr(fn, "__dataframe_filter__"):
-            return DataCollection(fn.__dataframe_apply__(self._iterable))
+        dataframe_filter = getattr(fn, "__dataframe_filter__", None)
+        if dataframe_filter is not None and hasattr(self._iterable, "apply"):
+            return DataCollection(dataframe_filter(self._iterable))
 
-        return self._factory(filter(inner, self._iterable))
+        result = filter(inner, self._iterable)
+        if not self.is_stream:
+            result = list(result)
+        return self._factory(result, parent_stream=False)
 
     def run(self, fn: Callable = None):
         """Iterate through the DataCollections data.
@@ -367,17 +411,17 @@ class DataFrame(DataCollection, DataFrameMixin, ColumnMixin):
                 Defaults to None.
         """
         if iterable is not None:
-            super().__init__(iterable)
+            super().__init__(iterable, parent)
             self._mode = self.ModeFlag.ROWBASEDFLAG
         else:
-            super().__init__(DataFrame.from_arrow_talbe(**kws))
+            super().__init__(DataFrame.from_arrow_table(**kws), parent)
             self._mode = self.ModeFlag.COLBASEDFLAG
 
     def _factory(self, iterable, parent_stream=True, mode=None) -> "DataFrame":
         """Factory method for Creating new DataFrames.
 
-        This factory method has been wrapped into a `param_scope()` which contains the
-        parent DataFrames's information.
+        The new DataFrame inherits the configuration of this DataFrame, which is
+        passed to it as the parent.
 
         Args:
             iterable (Iterable): The data being encapsulated by the DataFrame
@@ -398,11 +442,9 @@ class DataFrame(DataCollection, DataFrameMixin, ColumnMixin):
                 if isinstance(iterable, Iterator):
                     iterable = list(iterable)
 
-        with param_scope() as ps:
-            ps.data_collection.parent = self
-            df = DataFrame(iterable)
-            df._mode = self._mode if mode is None else mode
-            return df
+        df = DataFrame(iterable, parent=self)
+        df._mode = self._mode if mode is None else mode
+        return df
 
     def to_dc(self) -> "DataCollection":
         """Turn a DataFrame into a DataCollection.
@@ -469,7 +511,7 @@ class DataFrame(DataCollection, DataFrameMixin, ColumnMixin):
             >>> df.to_list()[0]
             <EntityView dict_keys(['a', 'b'])>
         """
-        if hasattr(self._iterable, "iterrows"):
+        if _has_iterrows(type(self._iterable)):
             return (x[1] for x in self._iterable.iterrows())
         if self._mode == self.ModeFlag.ROWBASEDFLAG:
             return iter(self._iterable)
@@ -18,6 +18,8 @@ class BaseExecution:
     Execute an operator
     """
 
+    __slots__ = ()
+
     def __apply__(self, *arg, **kws):
         # Multi inputs.
         if isinstance(self._index[0], tuple):
@@ -28,7 +30,8 @@ class BaseExecution:
         return self._op(*args, **kws)
 
     def __call__(self, *arg, **kws):
-        self.__check_init__()
+        if self._op is None:
+            self.__check_init__()
         if bool(self._index):
             res = self.__apply__(*arg, **kws)
 
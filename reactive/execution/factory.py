@@ -16,17 +16,21 @@
 # pylint: disable=dangerous-default-value
 
 import threading
+from concurrent.futures import Future
 from typing import Any, Dict, List, Tuple
 
 from hyperparameter import param_scope
 
-from ..types import dynamic_dispatch
+from ..types import DynamicDispatch
 from .base_execution import BaseExecution
 from .pandas_execution import PandasExecution
 from .registry import resolve
 from .stateful_execution import StatefulExecution
 from .vectorized_execution import VectorizedExecution
 
+# Only guards claiming a wrapper's init future; operators are built outside it.
+_INIT_LOCK = threading.Lock()
+
 
 def op(name: str, args: List[Any] = [], kwargs: Dict[str, Any] = {}):
     return resolve(name)(*args, **kwargs)
@@ -39,6 +43,16 @@ class _OperatorLazyWrapper(
     operator wrapper for lazy initialization. Inherits from different execution strategies.
     """
 
+    __slots__ = (
+        "_name",
+        "_index",
+        "_arg",
+        "_kws",
+        "_op",
+        "_init_future",
+        "__has_vcall__",
+    )
+
     def __init__(
         self,
         real_name: str,
@@ -51,41 +65,71 @@ class _OperatorLazyWrapper(
         self._index = index
         self._arg = arg
         self._kws = kws
-        self._lock = threading.Lock()
         self._op = None
+        self._init_future = None
+        self.__has_vcall__ = False
         if load:
             self.__check_init__()
             if self._op is None:
                 raise Exception(f"failed to load operator {real_name}")
 
     def __check_init__(self):
-        with self._lock:
-            if self._op is None:
-                #  Called with param scope in order to pass index in to op.
-                with param_scope(index=self._index):
-                    self._op = op(self._name, args=self._arg, kwargs=self._kws)
-                    if hasattr(self._op, "__vcall__"):
-                        self.__has_vcall__ = True
-        return self._op
+        if self._op is not None:
+            return self._op
+        with _INIT_LOCK:
+            if self._op is not None:
+                return self._op
+            future = self._init_future
+            owner = future is None
+            if owner:
+                future = self._init_future = Future()
+        if not owner:
+            return future.result()
+        try:
+            #  Called with param scope in order to pass index in to op.
+            with param_scope(index=self._index):
+                instance = op(self._name, args=self._arg, kwargs=self._kws)
+        except BaseException as e:
+            with _INIT_LOCK:
+                self._init_future = None
+            future.set_exception(e)
+            raise
+        self.__has_vcall__ = hasattr(type(instance), "__vcall__")
+        self._op = instance
+        # waiters hold their own reference; the wrapper no longer needs it
+        self._init_future = None
+        future.set_result(instance)
+        return instance
 
     @staticmethod
     def callback(real_name: str, index: Tuple[str], *arg, **kws):
         return _OperatorLazyWrapper(real_name, index, arg=arg, kws=kws)
 
 
-@dynamic_dispatch
-def ops(*arg, **kws):
+class _OpsDispatch(DynamicDispatch):
     """
     Entry point for creating operator instances, for example:
 
-    >>> op_instance = ops.my_namespace.my_repo_name(init_arg1=xxx, init_arg2=xxx)
+    >>> from reactive import register
+    >>> @register(name="my_namespace.add_n")
+    ... class add_n:
+    ...     def __init__(self, n):
+    ...         self.n = n
+    ...     def __call__(self, x):
+    ...         return x + self.n
+    >>> op_instance = ops.my_namespace.add_n(n=2)
+    >>> op_instance(1)
+    3
+
+    The name and index collected by attribute and item access are handed to
+    the wrapper directly, so no `param_scope` is entered per call.
     """
 
-    # pylint: disable=protected-access
-    with param_scope() as ps:
-        real_name = ps._name | None
-        index = ps._index | None
-    return _OperatorLazyWrapper.callback(real_name, index, *arg, **kws)
+    def __call__(self, *arg, **kws):
+        return self._func(self._name, self._index, *arg, **kws)
+
+
+ops = _OpsDispatch(_OperatorLazyWrapper.callback)
 
 
 def create_op(
@@ -98,4 +142,5 @@ def create_op(
     # pylint: disable=protected-access
     operator = _OperatorLazyWrapper(name, index, load=False, arg=arg, kws=kws)
     operator._op = func
+    operator.__has_vcall__ = hasattr(type(func), "__vcall__")
     return operator
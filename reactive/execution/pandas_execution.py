@@ -18,6 +18,8 @@ class PandasExecution:
     Execute operator on pandas DataFrame
     """
 
+    __slots__ = ()
+
     def __dataframe_apply__(self, df):
         self.__check_init__()
         if isinstance(self._index[1], tuple):
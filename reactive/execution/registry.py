@@ -12,15 +12,19 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import functools
 import types
 from typing import Any, Dict
 
 REGISTRY: Dict[str, Any] = {}
 
+_FunctionType = types.FunctionType
 
+
+@functools.lru_cache(maxsize=1024)
 def resolve(name: str) -> Any:
     """
-    Resolve operator by name
+    Resolve operator by name, the result is cached until the next `register`.
     """
     return REGISTRY.get(name, None)
 
@@ -63,6 +67,13 @@ def register(name: str = None):
         >>> ops.my_foo()(1,2)
         3
 
+        4. re-register an operator with the same name:
+        >>> @register(name='my_foo')
+        ... def foo(x, y):
+        ...     return x*y
+        >>> ops.my_foo()(1,2)
+        2
+
     Args:
         name (str, optional): operator name, will use the class/function name if None.
     """
@@ -76,7 +87,7 @@ def register(name: str = None):
         nonlocal name
         name = cls.__name__ if name is None else name
 
-        if isinstance(cls, types.FunctionType):
+        if type(cls) is _FunctionType:
             REGISTRY[name + "_func"] = cls
 
         # wrap a callable to a class
@@ -86,11 +97,12 @@ def register(name: str = None):
                 cls.__name__,
                 (object,),
                 {
-                    "__call__": lambda _, *arg, **kws: func(*arg, **kws),
+                    "__call__": staticmethod(func),
                     "__doc__": func.__doc__,
                 },
             )
         REGISTRY[name] = cls
+        resolve.cache_clear()
         return cls
 
     return wrapper
@@ -18,6 +18,8 @@ class StatefulExecution:
     Execute a stateful operator
     """
 
+    __slots__ = ()
+
     def train(self, *arg, **kws):
         self.__check_init__()
         return self._op.train(*arg, **kws)
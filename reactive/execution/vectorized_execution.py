@@ -20,12 +20,18 @@ class VectorizedExecution:
     Vectorized execute operator on Arrow tables
     """
 
+    __slots__ = ()
+
     def __vcall__(self, *arg, **kws):
-        self.__check_init__()
+        if self._op is None:
+            self.__check_init__()
         # col-based computing supported
-        if hasattr(self._op, "__vcall__"):
-            return self._op.__vcall__(*arg, **kws)
-        elif len(arg) == 1:
+        if self.__has_vcall__:
+            res = self._op.__vcall__(*arg, **kws)
+            if res is not NotImplemented:
+                return res
+        # row-wise fallback
+        if len(arg) == 1:
             res = [self._op(x) for x in arg[0]]
             if isinstance(self._index[1], tuple):
                 return tuple(list(i) for i in zip(*res))
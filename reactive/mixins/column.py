@@ -1,12 +1,75 @@
+import functools
 from enum import Flag, auto
 
-from hyperparameter import param_scope
-
 from reactive.types.storages import ChunkedTable, WritableTable
 
 
 # pylint: disable=import-outside-toplevel
-# pylint: disable=bare-except
+@functools.lru_cache(maxsize=256)
+def _flat_numpy_dtype(arrow_type):
+    """Numpy dtype of the innermost values of a (nested) list type.
+
+    >>> import pyarrow as pa
+    >>> _flat_numpy_dtype(pa.list_(pa.list_(pa.float32())))
+    <class 'numpy.float32'>
+    """
+    dtype = arrow_type
+    while hasattr(dtype, "value_type"):
+        dtype = dtype.value_type
+    return dtype.to_pandas_dtype()
+
+
+def _col_to_ndarray(col):
+    """Return a numpy view of an arrow column, copying only when unavoidable.
+
+    Examples:
+
+    >>> import pyarrow as pa
+    >>> _col_to_ndarray(pa.chunked_array([[1, 2], [3]]))
+    array([1, 2, 3])
+    >>> _col_to_ndarray(pa.chunked_array([[[1, 2], [3, 4]]]))
+    array([[1, 2],
+           [3, 4]])
+    """
+    import numpy as np
+    import pyarrow as pa
+
+    from reactive.types.tensor_array import TensorArray
+
+    data = col
+    if isinstance(col, pa.ChunkedArray):
+        if col.num_chunks == 1:
+            data = col.chunk(0)
+        elif col.num_chunks > 1 and pa.types.is_primitive(col.type):
+            return np.concatenate(
+                [c.to_numpy(zero_copy_only=False) for c in col.chunks]
+            )
+        elif col.num_chunks > 1:
+            data = col.combine_chunks()
+
+    # Tensors and lists are viewed through the buffer of their flat values.
+    if isinstance(data, (TensorArray, pa.lib.ListArray)):
+        buffer = data.buffers()[-1]
+        # Extension types are not hashable, key the cache on their storage type.
+        arrow_type = data.type
+        if isinstance(data, TensorArray):
+            arrow_type = arrow_type.storage_type
+        dtype = _flat_numpy_dtype(arrow_type)
+        shape = (
+            [-1, *data.type.shape] if isinstance(data, TensorArray) else [len(data), -1]
+        )
+        return np.frombuffer(buffer=buffer, dtype=dtype).reshape(shape)
+
+    try:
+        return data.to_numpy(zero_copy_only=True)
+    except (pa.ArrowInvalid, NotImplementedError):
+        return data.to_numpy(zero_copy_only=False)
+
+
+def _apply_chunk(dc, unary_op, chunk):
+    return WritableTable(dc.__table_apply__(chunk, unary_op))
+
+
 class ColumnMixin:
     """
     Mixins to support column-based storage.
@@ -19,7 +82,7 @@ class ColumnMixin:
 
     def __init__(self) -> None:
         super().__init__()
-        parent = param_scope.data_collection.parent | None
+        parent = self._parent
         if parent is not None and hasattr(parent, "_chunksize"):
             self._chunksize = parent._chunksize
 
@@ -104,42 +167,34 @@ class ColumnMixin:
         """
         import pyarrow as pa
 
-        from reactive.types.tensor_array import TensorArray
-
-        header = None
-        cols = None
+        from reactive.types.tensor_array import arrow_array
 
-        # cols = [[getattr(entity, col) for entity in self._iterable] for col in header]
-        def inner(entity):
-            nonlocal cols, header
-            header = [*entity.__dict__] if not header else header
-            cols = [[] for _ in header] if not cols else cols
-            for col, name in zip(cols, header):
-                col.append(getattr(entity, name))
+        rows = [entity.__dict__ for entity in self._iterable]
+        try:
+            return pa.Table.from_pylist(rows)
+        except (pa.ArrowException, TypeError, ValueError):
+            pass
 
-        for entity in self._iterable:
-            inner(entity)
-
-        arrays = []
-        for col in cols:
-            try:
-                arrays.append(pa.array(col))
-            # pylint: disable=bare-except
-            except:
-                arrays.append(TensorArray.from_numpy(col))
+        # Columns that arrow cannot infer, such as nd-arrays, are stored as tensors.
+        header = [*rows[0]]
+        arrays = [arrow_array([row[name] for row in rows]) for name in header]
 
         return pa.Table.from_arrays(arrays, names=header)
 
     @classmethod
     def from_arrow_table(cls, **kws):
+        """
+        Create an arrow table from columns passed as keyword arguments.
+
+        Examples:
+
+        >>> from reactive import DataFrame
+        >>> [e.a for e in DataFrame(a=[1, 2, 3])]
+        [1, 2, 3]
+        """
         import pyarrow as pa
 
-        arrays = []
-        names = []
-        for k, v in kws.items():
-            arrays.append(v)
-            names.append(k)
-        return pa.Table.from_arrays(arrays, names=names)
+        return pa.Table.from_pydict(kws)
 
     def to_column(self):
         """
@@ -200,16 +255,10 @@ class ColumnMixin:
         # pylint: disable=protected-access
         if self.get_executor() is None:
             if isinstance(self._iterable, ChunkedTable):
+                apply = functools.partial(_apply_chunk, self, unary_op)
+                tables = map(apply, self._iterable.chunks())
                 if not self.is_stream:
-                    tables = [
-                        WritableTable(self.__table_apply__(chunk, unary_op))
-                        for chunk in self._iterable.chunks()
-                    ]
-                else:
-                    tables = (
-                        WritableTable(self.__table_apply__(chunk, unary_op))
-                        for chunk in self._iterable.chunks()
-                    )
+                    tables = list(tables)
                 return self._factory(ChunkedTable(chunks=tables))
             return self._factory(self.__table_apply__(self._iterable, unary_op))
         else:
@@ -221,61 +270,11 @@ class ColumnMixin:
 
     def __col_apply__(self, cols, unary_op):
         # pylint: disable=protected-access
-        import numpy as np
-        import pyarrow as pa
-
-        from reactive.types.tensor_array import TensorArray
-
-        args = []
         # Multi inputs.
         if isinstance(unary_op._index[0], tuple):
-            for name in unary_op._index[0]:
-                try:
-                    data = cols[name].combine_chunks()
-                except:
-                    data = cols[name].chunk(0)
-
-                buffer = data.buffers()[-1]
-                dtype = data.type
-                if isinstance(data, TensorArray):
-                    dtype = dtype.storage_type.value_type
-                elif hasattr(data.type, "value_type"):
-                    while hasattr(dtype, "value_type"):
-                        dtype = dtype.value_type
-                dtype = dtype.to_pandas_dtype()
-                shape = (
-                    [-1, *data.type.shape]
-                    if isinstance(data, TensorArray)
-                    else [len(data), -1]
-                    if isinstance(data, pa.lib.ListArray)
-                    else [len(data)]
-                )
-                args.append(np.frombuffer(buffer=buffer, dtype=dtype).reshape(shape))
-                # args.append(data.to_numpy(zero_copy_only=False).reshape(shape))
-
+            args = [_col_to_ndarray(cols[name]) for name in unary_op._index[0]]
         # Single input.
         else:
-            try:
-                data = cols[unary_op._index[0]].combine_chunks()
-            except:
-                data = cols[unary_op._index[0]].chunk(0)
-
-            buffer = data.buffers()[-1]
-            dtype = data.type
-            if isinstance(data, TensorArray):
-                dtype = dtype.storage_type.value_type
-            elif hasattr(data.type, "value_type"):
-                while hasattr(dtype, "value_type"):
-                    dtype = dtype.value_type
-            dtype = dtype.to_pandas_dtype()
-            shape = (
-                [-1, *data.type.shape]
-                if isinstance(data, TensorArray)
-                else [len(data), -1]
-                if isinstance(data, pa.lib.ListArray)
-                else [len(data)]
-            )
-            args.append(np.frombuffer(buffer=buffer, dtype=dtype).reshape(shape))
-            # args.append(data.to_numpy(zero_copy_only=False).reshape(shape))
+            args = [_col_to_ndarray(cols[unary_op._index[0]])]
 
         return unary_op.__vcall__(*args)
@@ -1,3 +1,4 @@
+import functools
 from warnings import warn
 
 from hyperparameter import param_scope
@@ -6,12 +7,31 @@ from ..execution.factory import op, ops
 from ..execution.registry import resolve
 
 
+@functools.lru_cache(maxsize=64)
+def _numba_map_kernel(func, options=()):
+    """Compile `func` and a parallel loop applying it over a 1-d array.
+
+    `options` are extra `numba.njit` options, as sorted `(name, value)` pairs.
+    """
+    # pylint: disable=import-outside-toplevel
+    import numba
+
+    jitted = numba.njit(func, nogil=True, **dict(options))
+
+    @numba.njit(parallel=True, nogil=True, **dict(options))
+    def kernel(arr, out):
+        for i in numba.prange(arr.shape[0]):  # pylint: disable=not-an-iterable
+            out[i] = jitted(arr[i])
+
+    return jitted, kernel
+
+
 class NumbaCompiler:
     """
     The just-in-time Compiler with numba.
     """
 
-    def __init__(self, name, index, *arg, **kws):
+    def __init__(self, name, index, *arg, jit_options=(), **kws):
         from numba import njit  # pylint: disable=import-outside-toplevel
 
         name_func = [name + "_func", name.replace("_", "-") + "_func"]
@@ -22,12 +42,15 @@ class NumbaCompiler:
         if func is None:
             warn("The Operator: {} is not of types.FunctionType.".format(name))
             raise RuntimeError(f"The Operator: {name} is not of types.FunctionType.")
-        self._func = njit(func, nogil=True)
+        self._py_func = func
+        self._jit_options = jit_options
+        self._func = njit(func, nogil=True, **dict(jit_options))
         self._op = getattr(ops, name)[index](*arg, **kws)
         self._name = name
         self._index = index
         self._first = True
         self._success = True
+        self._vsuccess = True
 
     def __apply__(self, *arg):
         # Multi inputs.
@@ -82,6 +105,34 @@ class NumbaCompiler:
         else:
             return self._op.__call__(*arg, **kws)
 
+    def __vcall__(self, *arg, **kws):
+        """Vectorized call on column arrays, used by column-based data frames."""
+        # pylint: disable=import-outside-toplevel,broad-except
+        import numpy as np
+
+        if (
+            self._vsuccess
+            and not kws
+            and len(arg) == 1
+            and isinstance(arg[0], np.ndarray)
+            and arg[0].ndim == 1
+            and arg[0].size > 0
+            and arg[0].dtype.kind in "biuf"
+        ):
+            try:
+                jitted, kernel = _numba_map_kernel(self._py_func, self._jit_options)
+                out = np.empty(arg[0].shape, dtype=np.asarray(jitted(arg[0][0])).dtype)
+                kernel(arg[0], out)
+                return out
+            except Exception as e:
+                self._vsuccess = False
+                warn(
+                    "Failed to speed up your function:{} with error:{} in JIT mode, will back to Python interpreter.".format(
+                        self._name, e
+                    )
+                )
+        return self._op.__vcall__(*arg, **kws)
+
 
 class TowheeCompiler:  # pragma: no cover
     """
@@ -152,13 +203,7 @@ class CompileMixin:
 
     >>> @register(name='inner_distance')
     ... def inner_distance(query, data):
-    ...     dists = []
-    ...     for vec in data:
-    ...         dist = 0
-    ...         for i in range(len(vec)):
-    ...             dist += vec[i] * query[i]
-    ...         dists.append(dist)
-    ...     return dists
+    ...     return data @ query
     >>> data = [numpy.random.random((10000, 128)) for _ in range(10)]
     >>> query = numpy.random.random(128)
 
@@ -180,16 +225,32 @@ class CompileMixin:
     # >>> assert(t3-t2 < t2-t1)
     """
 
+    # Extra numba.njit options, as sorted (name, value) pairs.
+    _jit_options = ()
+
     def __init__(self) -> None:
         super().__init__()
-        with param_scope() as ps:
-            parent = ps.data_collection.parent(None)
+        parent = self._parent
         if parent is not None and hasattr(parent, "_jit"):
             self._jit = parent._jit
+            self._jit_options = parent._jit_options
+
+    def set_jit(self, compiler, **kws):
+        """
+        Set the just-in-time compiler for following calls.
 
-    def set_jit(self, compiler, **kws):  # pylint: disable=unused-argument
+        With `numba`, keyword arguments are passed on to `numba.njit`, e.g.
+        `fastmath=True` or `error_model='numpy'` to let reductions vectorize.
+
+        Examples:
+
+        >>> import reactive as rv
+        >>> rv.range(4).set_jit('numba', fastmath=True).njit_map(lambda x: x * 0.5)
+        [0.0, 0.5, 1.0, 1.5]
+        """
         if compiler in ["numba", "towhee"]:
             self._jit = compiler
+            self._jit_options = tuple(sorted(kws.items()))
         else:
             warn(
                 "Error when setting jit, please make sure the configuration about jit in ['numba']."
@@ -199,11 +260,45 @@ class CompileMixin:
             )
         return self
 
+    def njit_map(self, fn):
+        """
+        Apply a numeric function across an unstreamed data collection with numba.
+
+        The function and a parallel loop over the data are compiled with numba. Falls
+        back to `map` if the data is streamed or not numeric, if numba is not
+        installed or if the function cannot be compiled.
+
+        Examples:
+
+        >>> import reactive as rv
+        >>> rv.range(5).njit_map(lambda x: x * 2 + 1)
+        [1, 3, 5, 7, 9]
+        >>> rv.of(['a', 'b']).njit_map(lambda x: x + '!')
+        ['a!', 'b!']
+        """
+        # pylint: disable=import-outside-toplevel,broad-except
+        import numpy as np
+
+        if self.is_stream or not isinstance(self._iterable, (list, tuple, range)):
+            return self.map(fn)
+        arr = np.asarray(self._iterable)
+        if arr.ndim != 1 or arr.size == 0 or arr.dtype.kind not in "biuf":
+            return self.map(fn)
+        try:
+            jitted, kernel = _numba_map_kernel(fn, self._jit_options)
+            out = np.empty(arr.shape, dtype=np.asarray(jitted(arr[0])).dtype)
+            kernel(arr, out)
+        except Exception:
+            return self.map(fn)
+        return self._factory(out.tolist(), parent_stream=False)
+
     def jit_resolve(self, name, index, *arg, **kws):
         try:
             if isinstance(self._jit, str):
                 if self._jit == "numba":
-                    return NumbaCompiler(name, index, *arg, **kws)
+                    return NumbaCompiler(
+                        name, index, *arg, jit_options=self._jit_options, **kws
+                    )
                 if self._jit == "towhee":
                     return TowheeCompiler(name, index, *arg, **kws)
             else:
@@ -1,7 +1,5 @@
 from typing import Union
 
-from hyperparameter import param_scope
-
 
 class ConfigMixin:
     """Mixin to manage configurations such as `parallel`, `chunksize` and `jit`.
@@ -28,16 +26,10 @@ class ConfigMixin:
         >>> dc0 = dc0.set_jit('numba')
     """
 
-    def __init__(self) -> None:
-        super().__init__()
-        with param_scope() as ps:
-            parent = ps.data_collection.parent(None)
-        if parent is None or not hasattr(parent, "_num_worker"):
-            self._num_worker = None
-        if parent is None or not hasattr(parent, "_chunksize"):
-            self._chunksize = None
-        if parent is None or not hasattr(parent, "_jit"):
-            self._jit = None
+    # Class-level defaults, shadowed per instance once a setter is called.
+    _num_worker = None
+    _chunksize = None
+    _jit = None
 
     def config(
         self,
@@ -70,12 +62,8 @@ class ConfigMixin:
         """
         Return the config in DC, such as `parallel`, `chunksize` and `jit`.
         """
-        config = {}
-
-        if hasattr(self, "_num_worker"):
-            config["parallel"] = self._num_worker
-        if hasattr(self, "_chunksize"):
-            config["chunksize"] = self._chunksize
-        if hasattr(self, "_jit"):
-            config["jit"] = self._jit
-        return config
+        return {
+            "parallel": self._num_worker,
+            "chunksize": self._chunksize,
+            "jit": self._jit,
+        }
@@ -1,3 +1,5 @@
+import collections
+import itertools
 import random
 from typing import Iterable
 
@@ -5,6 +7,32 @@ from hyperparameter import param_scope
 
 from ..types import dynamic_dispatch
 from ..types.entity import Entity
+from ..types.storages import ChunkedTable, WritableTable
+
+
+def _table_windows(tables, size, drop_tail):
+    """
+    Re-slice a sequence of arrow tables into tables of `size` rows.
+
+    Slicing and concatenating arrow tables are zero-copy, so no row is
+    converted into python objects.
+    """
+    # pylint: disable=import-outside-toplevel
+    import pyarrow as pa
+
+    pending, count = [], 0
+    for table in tables:
+        offset, num_rows = 0, table.num_rows
+        while offset < num_rows:
+            part = table.slice(offset, size - count)
+            pending.append(part)
+            count += part.num_rows
+            offset += part.num_rows
+            if count == size:
+                yield WritableTable(pa.concat_tables(pending))
+                pending, count = [], 0
+    if not drop_tail and count > 0:
+        yield WritableTable(pa.concat_tables(pending))
 
 
 class DataProcessingMixin:
@@ -48,14 +76,7 @@ class DataProcessingMixin:
         >>> rv.range(10).head(3).to_list()
         [0, 1, 2]
         """
-
-        def inner():
-            for i, x in enumerate(self._iterable):
-                if i >= n:
-                    break
-                yield x
-
-        return self._factory(inner())
+        return self._factory(itertools.islice(self._iterable, n))
 
     def sample(self, ratio=1.0) -> "DataCollection":
         """
@@ -75,7 +96,20 @@ class DataProcessingMixin:
         >>> ratio = len(result.to_list()) / 10000.
         >>> 0.09 < ratio < 0.11
         True
+
+        >>> import random
+        >>> random.seed(0); first = rv.range(100).sample(0.5).to_list()
+        >>> random.seed(0); first == rv.range(100).sample(0.5).to_list()
+        True
         """
+        if not self.is_stream and type(self._iterable) in (list, tuple, range):
+            import numpy as np  # pylint: disable=import-outside-toplevel
+
+            # seeded from `random`, so `random.seed` keeps samples reproducible
+            rng = np.random.default_rng(random.getrandbits(64))
+            mask = rng.random(len(self._iterable)) < ratio
+            kept = list(itertools.compress(self._iterable, mask.tolist()))
+            return self._factory(kept, parent_stream=False)
         return self._factory(filter(lambda _: random.random() < ratio, self))
 
     def batch(self, size, drop_tail=False):
@@ -111,8 +145,27 @@ class DataProcessingMixin:
         >>> dc = rv.of([Entity(a=a, b=b) for a,b in zip(['abc', 'vdfvcd', 'cdsc'], [1,2,3])])
         >>> dc.batch(2)
         [[<Entity dict_keys(['a', 'b'])>, <Entity dict_keys(['a', 'b'])>], [<Entity dict_keys(['a', 'b'])>]]
+
+        Columnar data collections are batched into arrow tables without
+        converting rows into python objects:
+
+        >>> df = rv.of['a'](range(5)).set_chunksize(2)
+        >>> [batch.a.to_pylist() for batch in df.batch(3)]
+        [[0, 1, 2], [3, 4]]
         """
 
+        # pylint: disable=protected-access
+        if isinstance(self._iterable, (WritableTable, ChunkedTable)):
+            if isinstance(self._iterable, WritableTable):
+                tables = [self._iterable._table]
+            else:
+                tables = (chunk._table for chunk in self._iterable.chunks())
+            # each batch is a row of the new collection
+            return self._factory(
+                _table_windows(tables, size, drop_tail),
+                mode=self.ModeFlag.ROWBASEDFLAG,
+            )
+
         def inner():
             buff = []
             count = 0
@@ -167,8 +220,15 @@ class DataProcessingMixin:
         [[0], [0, 1], [4]]
         """
 
+        def advance(buff):
+            if step >= len(buff):
+                buff.clear()
+            else:
+                for _ in range(step):
+                    buff.popleft()
+
         def inner():
-            buff = []
+            buff = collections.deque()
             gap = 0
             head_flag = True
             for ele in self._iterable:
@@ -177,18 +237,19 @@ class DataProcessingMixin:
                     continue
 
                 buff.append(ele)
+                full = len(buff) == size
 
-                if not drop_head and head_flag or len(buff) == size:
-                    yield buff.copy()
+                if not drop_head and head_flag or full:
+                    yield list(buff)
 
-                if len(buff) == size:
+                if full:
                     head_flag = False
-                    buff = buff[step:]
+                    advance(buff)
                     gap = step - size if step > size else 0
 
             while not drop_tail and buff:
-                yield buff
-                buff = buff[step:]
+                yield list(buff)
+                advance(buff)
 
         return self._factory(inner())
 
@@ -221,10 +282,12 @@ class DataProcessingMixin:
 
         @dynamic_dispatch
         def flattener():
+            # pylint: disable=protected-access
+            with param_scope() as ps:
+                index = ps._index | None
+
             def inner():
                 for ele in self._iterable:
-                    # pylint: disable=protected-access
-                    index = param_scope._index | None
                     # With schema
                     if isinstance(ele, Entity):
                         if not index:
@@ -271,5 +334,7 @@ class DataProcessingMixin:
         """
         if self.is_stream:
             raise TypeError("shuffle is not supported for streamed data collection.")
-        iterable = random.sample(self._iterable, len(self._iterable))
-        return self._factory(iterable)
+        # Shuffle a copy, the parent data collection is left untouched.
+        iterable = list(self._iterable)
+        random.shuffle(iterable)
+        return self._factory(iterable, parent_stream=False)
@@ -102,7 +102,8 @@ class DataFrameMixin:
 
         @dynamic_dispatch
         def selector(*arg):
-            index = param_scope._index | None
+            with param_scope() as ps:
+                index = ps._index | None
             if isinstance(index, str):
                 index = (index,)
             if index is None and arg is not None and len(arg) > 0:
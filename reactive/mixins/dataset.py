@@ -1,23 +1,65 @@
+import math
+import numbers
 import re
+from collections.abc import Sequence
 from pathlib import Path
 
 from reactive.types.entity import Entity
+from reactive.types.storages import ChunkedTable, WritableTable
+
+_URL_RE = re.compile(
+    r"^(?:http|ftp)s?://"  # http:// or https://
+    r"(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+(?:[A-Z]{2,6}\.?|[A-Z0-9-]{2,}\.?)|"  # domain...
+    r"localhost|"  # localhost...
+    r"\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})"  # ...or ip
+    r"(?::\d+)?"  # optional port
+    r"(?:/?|[/?]\S+)$",
+    re.IGNORECASE,
+)
 
 
 def _url_valid(uri) -> bool:
-    regex = re.compile(
-        r"^(?:http|ftp)s?://"  # http:// or https://
-        r"(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+(?:[A-Z]{2,6}\.?|[A-Z0-9-]{2,}\.?)|"  # domain...
-        r"localhost|"  # localhost...
-        r"\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})"  # ...or ip
-        r"(?::\d+)?"  # optional port
-        r"(?:/?|[/?]\S+)$",
-        re.IGNORECASE,
-    )
+    return _URL_RE.match(uri) is not None
 
-    if re.match(regex, uri) is not None:
-        return True
-    return False
+
+def _split_sizes(n, train_size, test_size):
+    """
+    Return `(n_train, n_test)` as sklearn's `train_test_split` computes them, or
+    None when sklearn should handle the sizes, including raising for bad ones.
+
+    >>> _split_sizes(10, 0.9, 0.1)
+    (9, 1)
+    >>> _split_sizes(10, 0.8, None) is None
+    True
+    >>> _split_sizes(10, 0.9, 0.5) is None
+    True
+    """
+    sizes = []
+    for size, rounding in ((train_size, math.floor), (test_size, math.ceil)):
+        if isinstance(size, numbers.Integral) and not isinstance(size, bool):
+            if not 0 < size < n:
+                return None
+            sizes.append(int(size))
+        elif isinstance(size, float):
+            if not 0 < size < 1:
+                return None
+            sizes.append(rounding(size * n))
+        else:
+            return None
+    if all(isinstance(x, float) for x in (train_size, test_size)):
+        if train_size + test_size > 1:
+            return None
+    n_train, n_test = sizes
+    if n_train == 0 or n_train + n_test > n:
+        return None
+    return n_train, n_test
+
+
+def _entities(chunks):
+    """Yield an Entity per row of each pandas DataFrame in `chunks`."""
+    for chunk in chunks:
+        for record in chunk.to_dict(orient="records"):
+            yield Entity(**record)
 
 
 class DatasetMixin:
@@ -42,7 +84,10 @@ class DatasetMixin:
             4  4  4
         """
         if stream:
-            return cls(dataframe.iterrows()).map(lambda x: Entity(**x[1].to_dict()))
+            chunks = (
+                dataframe.iloc[i : i + 1024] for i in range(0, len(dataframe), 1024)
+            )
+            return cls(_entities(chunks))
         return cls(dataframe)
 
     def to_pandas(self):
@@ -54,9 +99,19 @@ class DatasetMixin:
                a
             0  1
             1  2
+
+            Columnar data is converted by arrow directly:
+
+            >>> rv.of['a'](range(3)).to_column().to_pandas()
+               a
+            0  0
+            1  1
+            2  2
         """
         import pandas as pd
 
+        if isinstance(self._iterable, (WritableTable, ChunkedTable)):
+            return self._iterable.to_arrow().to_pandas()
         return pd.DataFrame.from_records(data=self.as_dict().to_list())
 
     # pylint: disable=import-outside-toplevel
@@ -141,13 +196,7 @@ class DatasetMixin:
 
         reader = pd.read_json(*args, **kwargs)
         if hasattr(reader, "get_chunk") or hasattr(reader, "chunksize"):
-
-            def inner():
-                for chunk in reader:
-                    for row in chunk.iterrows():
-                        yield Entity(**row[1].to_dict())
-
-            return cls(inner())
+            return cls(_entities(reader))
         return cls.from_pandas(reader, stream=stream)
 
     @classmethod
@@ -182,13 +231,7 @@ class DatasetMixin:
 
         reader = pd.read_csv(*args, **kwargs)
         if hasattr(reader, "get_chunk"):
-
-            def inner():
-                for chunk in reader:
-                    for row in chunk.iterrows():
-                        yield Entity(**row[1].to_dict())
-
-            return cls(inner())
+            return cls(_entities(reader))
         return cls.from_pandas(reader, stream=stream)
 
     def to_csv(self, *args, **kwargs):
@@ -230,10 +273,20 @@ class DatasetMixin:
         >>> test.to_list()
         [9]
         """
-        from sklearn.model_selection import train_test_split
-
         train_size = size[0]
         test_size = size[1]
+
+        # Without shuffling the split is two plain slices, sized as sklearn does.
+        if kws == {"shuffle": False} and isinstance(self._iterable, Sequence):
+            sizes = _split_sizes(len(self._iterable), train_size, test_size)
+            if sizes is not None:
+                n_train, n_test = sizes
+                train = self._iterable[:n_train]
+                test = self._iterable[n_train : n_train + n_test]
+                return self._factory(train), self._factory(test)
+
+        from sklearn.model_selection import train_test_split
+
         train, test = train_test_split(
             self._iterable, train_size=train_size, test_size=test_size, **kws
         )
@@ -12,23 +12,88 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import functools
+import operator
+from inspect import CO_OPTIMIZED
 from types import FrameType
 
 from hyperparameter import param_scope
 
-from ..execution.factory import create_op, ops
+from ..execution.factory import _OperatorLazyWrapper, create_op, ops
+from ..execution.registry import REGISTRY
 
 
-def getattr_nested(mod, path):
-    # pylint: disable=bare-except
+@functools.lru_cache(maxsize=256)
+def _split_name(name):
+    """Split a dispatched name into `(mod_name, attr_name)`, cached per name.
+
+    >>> _split_name("math.sin")
+    ('math', 'sin')
+    >>> _split_name("add_1")
+    ('add_1', None)
+    """
+    if name and "." in name:
+        mod_name, attr_name = name.split(".", 1)
+        return mod_name, attr_name
+    return name, None
+
+
+_MISSING = object()
+
+
+@functools.lru_cache(maxsize=256)
+def _attrgetter(path):
+    return operator.attrgetter(path)
+
+
+def _call_ops(name, index, *arg, **kws):
+    """Create `ops.<name>[index](*arg, **kws)`, skipping dispatch for registered ops."""
+    if name in REGISTRY:
+        return _OperatorLazyWrapper.callback(name, index, *arg, **kws)
+    return ops._resolve_child(name, index)(*arg, **kws)
+
 
-    obj = mod
-    for par in path.split("."):
-        try:
-            obj = getattr(obj, par)
-        except:
-            return None
-    return obj
+def _lookup_name(frame, name):
+    """Look up `name` in the locals, then the globals, of `frame`.
+
+    Reading `f_locals` of a function frame builds a dict snapshot, so it is
+    skipped unless `name` is one of the function's local variables.
+
+    >>> import sys
+    >>> def f():
+    ...     math = "local"
+    ...     frame = sys._getframe()
+    ...     return _lookup_name(frame, "math"), _lookup_name(frame, "sys")
+    >>> f() == ("local", sys)
+    True
+    """
+    if not isinstance(frame, FrameType):
+        return None
+    code = frame.f_code
+    if (
+        not code.co_flags & CO_OPTIMIZED
+        or name in code.co_varnames
+        or name in code.co_cellvars
+        or name in code.co_freevars
+    ):
+        local = frame.f_locals.get(name, _MISSING)
+        if local is not _MISSING:
+            return local
+    return frame.f_globals.get(name, None)
+
+
+def getattr_nested(mod, path):
+    """
+    >>> import os
+    >>> getattr_nested(os, "path.join") is os.path.join
+    True
+    >>> getattr_nested(os, "path.not_exist") is None
+    True
+    """
+    try:
+        return _attrgetter(path)(mod)
+    except AttributeError:
+        return None
 
 
 class DispatcherMixin:
@@ -64,32 +129,26 @@ class DispatcherMixin:
     """
 
     def resolve(self, stack: FrameType = None, *arg, **kws):
-        locals_ = stack.f_locals if isinstance(stack, FrameType) else {}
-        globals_ = stack.f_globals if isinstance(stack, FrameType) else {}
         with param_scope() as ps:
             name = ps._name | None
             index = ps._index | None
-            if self._jit is not None:
-                op = self.jit_resolve(name, index, *arg, **kws)
-                if op is not None:
-                    return op
-            if name and "." in name:
-                mod_name, attr_name = name.split(".", 1)
-            else:
-                mod_name, attr_name = name, None
-            mod = globals_.get(mod_name, None)
-            mod = locals_.get(mod_name, mod)
-
-            if mod is ops:
-                return getattr(ops, attr_name)[index](*arg, **kws)
-            if mod is not None:
-                op = getattr_nested(mod, attr_name) if attr_name is not None else mod
+        if self._jit is not None:
+            op = self.jit_resolve(name, index, *arg, **kws)
+            if op is not None:
+                return op
+        mod_name, attr_name = _split_name(name)
+        mod = _lookup_name(stack, mod_name)
+
+        if mod is ops:
+            return _call_ops(attr_name, index, *arg, **kws)
+        if mod is not None:
+            op = getattr_nested(mod, attr_name) if attr_name is not None else mod
+        else:
+            op = None
+        if op is not None and callable(op):
+            if isinstance(op, type):
+                instance = op(*arg, **kws)
             else:
-                op = None
-            if op is not None and callable(op):
-                if isinstance(op, type):
-                    instance = op(*arg, **kws)
-                else:
-                    instance = op
-                return create_op(instance, name, index, arg, kws)
-            return getattr(ops, name)[index](*arg, **kws)
+                instance = op
+            return create_op(instance, name, index, arg, kws)
+        return _call_ops(name, index, *arg, **kws)
@@ -12,10 +12,15 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import concurrent.futures
+import functools
+import operator
+
 import numpy as np
 from hyperparameter import param_scope
 
 from ..types import dynamic_dispatch
+from ..types.storages import ChunkedTable, WritableTable
 
 
 class Collector:
@@ -28,6 +33,8 @@ class Collector:
         self.metrics = metrics if metrics is not None else []
         self.scores = scores if scores is not None else {}
         self.labels = labels if labels is not None else {}
+        # Label columns already extracted from the collection, keyed by field name.
+        self.columns = {}
 
     def add_scores(self, value: dict):
         self.scores.update(value)
@@ -37,61 +44,237 @@ class Collector:
 
 
 def encode_fig_img(mat, size=300):
+    """Render a confusion matrix as an inline `<img>` tag.
+
+    The rendering is cached on the matrix content, so reporting the same
+    scores again does not re-plot them.
+    """
+    mat = np.asarray(mat)
+    return _encode_fig_img(mat.tobytes(), mat.shape, mat.dtype.str, size)
+
+
+@functools.lru_cache(maxsize=64)
+def _encode_fig_img(data, shape, dtype, size):
     # pylint: disable=import-outside-toplevel
     import base64
     import io
 
-    import matplotlib as mpl
-    from sklearn.metrics import ConfusionMatrixDisplay
+    from matplotlib import colormaps
+    from PIL import Image, ImageDraw
 
-    mpl.use("Agg")  # Prevent showing stuff
+    mat = np.frombuffer(data, dtype=dtype).reshape(shape)
     cm = mat.astype("float") / mat.sum(axis=1)[:, np.newaxis]  # normalize
-    fig = ConfusionMatrixDisplay(cm)
-    fig.plot(cmap="GnBu")
+
+    # Paint the cells straight into an image, with no matplotlib figure or layout.
+    cell = max(size // len(cm), 1)
+    rgb = (colormaps["GnBu"](cm)[..., :3] * 255).astype(np.uint8)
+    img = Image.fromarray(rgb).resize((cell * len(cm),) * 2, Image.NEAREST)
+    draw = ImageDraw.Draw(img)
+    for (i, j), value in np.ndenumerate(cm):
+        xy = ((j + 0.5) * cell, (i + 0.5) * cell)
+        fill = "white" if value > 0.5 else "black"
+        draw.text(xy, f"{value:.2g}", fill=fill, anchor="mm")
     buf = io.BytesIO()
-    fig.figure_.savefig(buf, format="jpg")
-    buf.seek(0)
-    buf = buf.read()
-    src = 'src="data:image/jpeg;base64,' + base64.b64encode(buf).decode() + '" '
+    img.save(buf, format="PNG")
+
+    encoded = base64.b64encode(buf.getvalue()).decode()
+    src = 'src="data:image/png;base64,' + encoded + '" '
     w = 'width = "' + str(size) + 'px" '
     h = 'height = "' + str(size) + 'px" '
     return "<img " + src + w + h + ">"
 
 
 def get_scores_dict(collector: Collector):
-    scores_dict = {}
-    for metric in collector.metrics:
-        scores_dict[metric] = []
-        for model in collector.scores:
-            scores_dict[metric].append(collector.scores[model][metric])
+    return {
+        metric: [scores[metric] for scores in collector.scores.values()]
+        for metric in collector.metrics
+    }
+
 
-    return scores_dict
+def _flat_rows(rows):
+    """Flatten rows of integer ndarrays into `(values, offsets)`.
+
+    Row `i` is `values[offsets[i]:offsets[i + 1]]`. Returns None for other
+    rows, such as python lists, which are faster to compare as python sets
+    than to convert.
+
+    >>> _flat_rows([np.array([1, 2]), np.array([]), np.array([3])])
+    (array([1, 2, 3]), array([0, 2, 2, 3]))
+    >>> _flat_rows([[1, 2], [3]]) is None
+    True
+    """
+    if not all(isinstance(row, np.ndarray) for row in rows):
+        return None
+    parts = [row for row in rows if row.size]
+    values = np.concatenate(parts) if parts else np.empty(0, dtype=np.int64)
+    if values.ndim != 1 or values.dtype.kind not in "iu":
+        return None
+    lens = np.fromiter(map(len, rows), dtype=np.int64, count=len(rows))
+    offsets = np.zeros(len(rows) + 1, dtype=np.int64)
+    np.cumsum(lens, out=offsets[1:])
+    return values, offsets
+
+
+def _row_keys(flat_a, flat_p):
+    """Encode the `(row, value)` pairs of both sides as single int64 keys.
+
+    Every key divided by `span` gives back its row. Returns None when the
+    keys would overflow.
+    """
+    values = np.concatenate([flat_a[0], flat_p[0]])
+    low, high = (int(values.min()), int(values.max())) if values.size else (0, 0)
+    span = high - low + 1
+    if high >= 2**63 or span * max(len(flat_a[1]) - 1, 1) >= 2**63:
+        return None
+
+    def encode(vals, offsets):
+        rows = np.repeat(np.arange(len(offsets) - 1), np.diff(offsets))
+        return rows * span + (vals.astype(np.int64) - low)
+
+    return span, encode(*flat_a), encode(*flat_p)
+
+
+@functools.lru_cache(maxsize=None)
+def _jit_kernel(func):
+    """Compile a kernel with numba, or return None when numba is not installed."""
+    try:
+        import numba  # pylint: disable=import-outside-toplevel
+    except ImportError:
+        return None
+    return numba.njit(func, cache=True, nogil=True)
+
+
+def _hit_ratios(act, act_offsets, pre, pre_offsets):
+    ratios = np.zeros(len(act_offsets) - 1)
+    for r in range(len(ratios)):
+        pre_row = np.sort(pre[pre_offsets[r] : pre_offsets[r + 1]])
+        hits = 0
+        for a in np.unique(act[act_offsets[r] : act_offsets[r + 1]]):
+            j = np.searchsorted(pre_row, a)
+            if j < len(pre_row) and pre_row[j] == a:
+                hits += 1
+        ratios[r] = hits / (act_offsets[r + 1] - act_offsets[r])
+    return ratios
+
+
+def _average_precisions(act, act_offsets, pre, pre_offsets):
+    aps = np.zeros(len(act_offsets) - 1)
+    for r in range(len(aps)):
+        act_row = np.sort(act[act_offsets[r] : act_offsets[r + 1]])
+        start = pre_offsets[r]
+        cnt = 0
+        precision_sum = 0.0
+        for i in range(pre_offsets[r + 1] - start):
+            j = np.searchsorted(act_row, pre[start + i])
+            if j < len(act_row) and act_row[j] == pre[start + i]:
+                cnt += 1
+                precision_sum += cnt / (i + 1)
+        if cnt:
+            aps[r] = precision_sum / cnt
+    return aps
 
 
 def mean_hit_ratio(actual, predicted):
+    """Mean over rows of the fraction of distinct actual items that were predicted.
+
+    Rows of integer ndarrays are computed by a numba kernel, or with numpy set
+    operations when numba is not installed.
+
+    >>> mean_hit_ratio([[1, 2, 3, 4], [5, 6]], [[4, 1, 9], [7]])
+    0.25
+    >>> mean_hit_ratio(np.array([[1, 2, 3, 4]]), np.array([[4, 1, 9, 1]]))
+    0.5
+    """
+    flat_a, flat_p = _flat_rows(actual), _flat_rows(predicted)
+    if flat_a is not None and flat_p is not None:
+        kernel = _jit_kernel(_hit_ratios)
+        if kernel is not None:
+            return float(np.mean(kernel(*flat_a, *flat_p)))
+        keys = _row_keys(flat_a, flat_p)
+        if keys is not None:
+            span, key_a, key_p = keys
+            key_a = np.unique(key_a)
+            rows = len(actual)
+            hits = np.bincount(key_a[np.isin(key_a, key_p)] // span, minlength=rows)
+            return float(np.mean(hits / np.diff(flat_a[1])))
+
     ratios = []
     for act, pre in zip(actual, predicted):
         hit_num = len(set(act) & set(pre))
         ratios.append(hit_num / len(act))
-
     return sum(ratios) / len(ratios)
 
 
 def mean_average_precision(actual, predicted):
+    """Mean over rows of the average precision of the predicted ranking.
+
+    Rows of integer ndarrays are computed by a numba kernel, or with numpy
+    cumulative sums when numba is not installed.
+
+    >>> mean_average_precision([[1, 2], [3]], [[1, 5, 2], [4]])
+    0.41666666666666663
+    >>> mean_average_precision(np.array([[1, 2]]), np.array([[1, 5, 2]]))
+    0.8333333333333333
+    """
+    flat_a, flat_p = _flat_rows(actual), _flat_rows(predicted)
+    if flat_a is not None and flat_p is not None:
+        kernel = _jit_kernel(_average_precisions)
+        if kernel is not None:
+            return float(np.mean(kernel(*flat_a, *flat_p)))
+        keys = _row_keys(flat_a, flat_p)
+        if keys is not None:
+            return float(np.mean(_average_precisions_numpy(*keys, len(actual))))
+
     aps = []
     for act, pre in zip(actual, predicted):
+        act = set(act)
         cnt = 0
         precision_sum = 0
         for i, p in enumerate(pre):
             if p in act:
                 cnt += 1
                 precision_sum += cnt / (i + 1)
-            ap = precision_sum / cnt if cnt else 0
-        aps.append(ap)
-
+        aps.append(precision_sum / cnt if cnt else 0)
     return sum(aps) / len(aps)
 
 
+def _average_precisions_numpy(span, key_a, key_p, rows):
+    row_of = key_p // span
+    lens = np.bincount(row_of, minlength=rows)
+    starts = np.cumsum(lens) - lens
+
+    hit = np.isin(key_p, key_a)
+    cum = np.cumsum(hit)
+    cum_before = np.concatenate([[0], cum])[starts]
+    rank = np.arange(1, len(key_p) + 1) - starts[row_of]
+    precision = np.where(hit, (cum - cum_before[row_of]) / rank, 0.0)
+
+    precision_sum = np.bincount(row_of, weights=precision, minlength=rows)
+    cnt = np.bincount(row_of, weights=hit, minlength=rows)
+    return np.divide(precision_sum, cnt, out=np.zeros(rows), where=cnt > 0)
+
+
+_METRIC_FNS = {
+    "mean_hit_ratio": mean_hit_ratio,
+    "mean_average_precision": mean_average_precision,
+}
+
+
+def _metric_fn(metric_type):
+    """Look up a metric function, registering the sklearn ones on first use."""
+    if metric_type not in _METRIC_FNS:
+        from sklearn import metrics  # pylint: disable=import-outside-toplevel
+
+        _METRIC_FNS.update(
+            {
+                "accuracy": metrics.accuracy_score,
+                "recall": functools.partial(metrics.recall_score, average="weighted"),
+                "confusion_matrix": metrics.confusion_matrix,
+            }
+        )
+    return _METRIC_FNS[metric_type]
+
+
 class MetricMixin:
     """
     Mixin for metric
@@ -106,6 +289,22 @@ class MetricMixin:
         self.collector.metrics = metric_types
         return self
 
+    def _metric_columns(self, *names):
+        """Extract label columns, reusing the ones earlier evaluations extracted."""
+        columns = self.collector.columns
+        missing = [name for name in dict.fromkeys(names) if name not in columns]
+        if missing and isinstance(self._iterable, (WritableTable, ChunkedTable)):
+            table = self._iterable.to_arrow()
+            for name in missing:
+                columns[name] = table[name].to_numpy(zero_copy_only=False)
+        elif len(missing) == 1:
+            columns[missing[0]] = list(map(operator.attrgetter(missing[0]), self))
+        elif missing:
+            rows = list(map(operator.attrgetter(*missing), self))
+            for i, name in enumerate(missing):
+                columns[name] = [row[i] for row in rows]
+        return [columns[name] for name in names]
+
     @property
     def evaluate(self):
         @dynamic_dispatch
@@ -124,27 +323,10 @@ class MetricMixin:
                 {name: {"actual": actual, "predicted": predicted}}
             )
             score = {name: {}}
-            actual_list = []
-            predicted_list = []
-            for x in self:
-                actual_list.append(getattr(x, actual))
-                predicted_list.append(getattr(x, predicted))
-
-            from sklearn import metrics
+            actual_list, predicted_list = self._metric_columns(actual, predicted)
 
             for metric_type in self.collector.metrics:
-                if metric_type == "accuracy":
-                    re = metrics.accuracy_score(actual_list, predicted_list)
-                elif metric_type == "recall":
-                    re = metrics.recall_score(
-                        actual_list, predicted_list, average="weighted"
-                    )
-                elif metric_type == "confusion_matrix":
-                    re = metrics.confusion_matrix(actual_list, predicted_list)
-                elif metric_type == "mean_hit_ratio":
-                    re = mean_hit_ratio(actual_list, predicted_list)
-                elif metric_type == "mean_average_precision":
-                    re = mean_average_precision(actual_list, predicted_list)
+                re = _metric_fn(metric_type)(actual_list, predicted_list)
                 score[name].update({metric_type: re})
             self.collector.add_scores(score)
             return self
@@ -183,13 +365,10 @@ class MetricMixin:
         df = pd.DataFrame(data=scores_dict, index=list(self.collector.scores.keys()))
 
         if "confusion_matrix" in self.collector.metrics:
-            display(
-                HTML(
-                    df.to_html(
-                        formatters={"confusion_matrix": encode_fig_img}, escape=False
-                    )
-                )
-            )
+            # Render the images of all models concurrently, ahead of the table.
+            with concurrent.futures.ThreadPoolExecutor() as pool:
+                images = list(pool.map(encode_fig_img, df["confusion_matrix"]))
+            display(HTML(df.assign(confusion_matrix=images).to_html(escape=False)))
         else:
             display(df)
         return self.collector.scores
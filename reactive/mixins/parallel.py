@@ -1,17 +1,9 @@
-import asyncio
+import collections
 import concurrent.futures
 import threading
-import time
 from queue import Queue
 from warnings import warn
 
-try:
-    import torch
-except:  # pylint: disable=bare-except
-    pass
-
-from hyperparameter import param_scope
-
 from reactive.types.option import Empty, Option, _Reason
 from reactive.types.storages import ChunkedTable, WritableTable
 
@@ -19,8 +11,12 @@ stream = threading.local()
 
 
 def initializer():
-    # pylint: disable=bare-except
+    # pylint: disable=bare-except,import-outside-toplevel
+    # torch is imported here rather than at module level, it takes seconds to load
+    # and is only needed once a worker pool is started.
     try:
+        import torch
+
         if torch.cuda.is_available():
             stream.stream = torch.cuda.Stream()
     except:
@@ -68,8 +64,7 @@ class ParallelMixin:
 
     def __init__(self) -> None:
         super().__init__()
-        with param_scope() as ps:
-            parent = ps.data_collection.parent | None
+        parent = self._parent
         if parent is not None and hasattr(parent, "_executor"):
             self._backend = parent._backend
             self._executor = parent._executor
@@ -145,29 +140,30 @@ class ParallelMixin:
             queues = [Queue(count) for _ in range(count)]
         else:
             queues = [Queue() for _ in range(count)]
-        loop = asyncio.new_event_loop()
+        # Signalled by the consumers whenever they free a slot in their queue.
+        space = threading.Condition()
 
         def inner(queue):
             while True:
                 x = queue.get()
+                with space:
+                    space.notify()
                 if isinstance(x, EOS):
                     break
                 else:
                     yield x
 
-        async def worker():
-            cached_values = {x: [] for x in range(count)}
+        def worker():
+            cached_values = {x: collections.deque() for x in range(count)}
 
             for x in self:
-                # TODO: Use some kind of event instead of wait
-                sleepy = 0.01
-                while all(y.full() for y in queues):
-                    time.sleep(sleepy)
+                with space:
+                    space.wait_for(lambda: not all(y.full() for y in queues))
 
                 for i, queue in enumerate(queues):
                     if len(cached_values[i]) > 0:
                         while not queue.full() and len(cached_values[i]) > 0:
-                            queue.put(cached_values[i].pop(0))
+                            queue.put(cached_values[i].popleft())
                     if len(cached_values[i]) == 0 and not queue.full():
                         queue.put(x)
                     else:
@@ -178,32 +174,39 @@ class ParallelMixin:
                 cached_values[i].append(poison)
 
             while len(cached_values) > 0:
+                with space:
+                    space.wait_for(
+                        lambda: any(not queues[x].full() for x in cached_values)
+                    )
                 for x in list(cached_values.keys()):
                     if len(cached_values[x]) == 0:
                         del cached_values[x]
                     else:
                         while not queues[x].full() and len(cached_values[x]) > 0:
-                            queues[x].put(cached_values[x].pop(0))
-
-        def worker_wrapper():
-            loop.run_until_complete(worker())
-            loop.close()
+                            queues[x].put(cached_values[x].popleft())
 
-        t = threading.Thread(target=worker_wrapper, daemon=True)
+        t = threading.Thread(target=worker, daemon=True)
         t.start()
         retval = [inner(queue) for queue in queues]
         return [self._factory(x) for x in retval]
 
-    def _map_task(self, x, unary_op):
+    def _task_apply(self, unary_op):
+        """Choose how each element of a stage is applied, once per stage."""
+        if isinstance(self._iterable, ChunkedTable):
+            # The elements are the table's chunks.
+            return lambda x: WritableTable(self.__table_apply__(x, unary_op))
+
+        def apply(x):
+            if isinstance(x, Option):
+                return x.map(unary_op)
+            return unary_op(x)
+
+        return apply
+
+    def _map_task(self, x, unary_op, apply):
         def inner():
             try:
-                if isinstance(x, Option):
-                    res = x.map(unary_op)
-                elif isinstance(x, WritableTable):
-                    res = WritableTable(self.__table_apply__(x, unary_op))
-                else:
-                    res = unary_op(x)
-                return res
+                return apply(x)
             except Exception as e:  # pylint: disable=broad-except
                 warn(
                     f"{e}, please check {x} with op {unary_op}. Continue..."
@@ -212,17 +215,21 @@ class ParallelMixin:
 
         def map_wrapper():
             if hasattr(stream, "stream"):
-                torch.cuda.synchronize()
+                import torch  # pylint: disable=import-outside-toplevel
+
+                # Order against work already queued on the default stream, and
+                # wait for this worker's stream only rather than the whole device.
+                stream.stream.wait_stream(torch.cuda.current_stream())
                 with torch.cuda.stream(stream.stream):
                     res = inner()
-                torch.cuda.synchronize()
+                stream.stream.synchronize()
                 return res
             else:
                 return inner()
 
         return map_wrapper
 
-    def pmap(self, unary_op, num_worker=None, backend=None):
+    def pmap(self, unary_op, num_worker=None, backend=None, ordered=True):
         """
         Apply `unary_op` with parallel execution.
         Currently supports two backends, `ray` and `thread`.
@@ -231,6 +238,9 @@ class ParallelMixin:
             unary_op (func): the op to be mapped;
             num_worker (int): how many threads to reserve for this op;
             backend (str): whether to use `ray` or `thread`
+            ordered (bool): keep the input order, defaults to True. With the
+                `thread` backend, `ordered=False` emits results as they complete,
+                so a slow element does not hold back the ones behind it;
 
         Examples:
 
@@ -247,16 +257,21 @@ class ParallelMixin:
         True
         >>> len(stage_2_thread_set) > 1
         True
+
+        >>> sorted(rv.range(10).pmap(lambda x: x * 2, 4, ordered=False))
+        [0, 2, 4, 6, 8, 10, 12, 14, 16, 18]
         """
-        backend = self.get_backend()
+        backend = backend or self.get_backend()
         if backend == "ray":
             return self._ray_pmap(unary_op, num_worker)
-        return self._thread_pmap(unary_op, num_worker)
+        return self._thread_pmap(unary_op, num_worker, ordered)
 
-    def _thread_pmap(self, unary_op, num_worker=None):
+    def _thread_pmap(self, unary_op, num_worker=None, ordered=True):
         if num_worker is None and self.get_num_worker() is None:
             num_worker = 2
-        if num_worker is not None:
+        # A per-call pool, so nested pmaps never wait on their own workers.
+        owned = num_worker is not None
+        if owned:
             executor = concurrent.futures.ThreadPoolExecutor(
                 max_workers=num_worker, initializer=initializer
             )
@@ -264,20 +279,33 @@ class ParallelMixin:
             executor = self._executor
             num_worker = self._num_worker
 
-        queue = Queue(num_worker)
-        loop = asyncio.new_event_loop()
+        # Room for a second round of results so the consumer can drain while
+        # the producer keeps scheduling.
+        queue = Queue(2 * num_worker)
 
         def inner():
             while True:
                 x = queue.get()
-                queue.task_done()
                 if isinstance(x, EOS):
                     break
                 else:
                     yield x
 
-        async def worker():
-            buff = []
+        apply = self._task_apply(unary_op)
+
+        def put_next(buff):
+            if ordered:
+                queue.put(buff.popleft().result())
+                return
+            done, _ = concurrent.futures.wait(
+                buff, return_when=concurrent.futures.FIRST_COMPLETED
+            )
+            for fut in done:
+                buff.remove(fut)
+                queue.put(fut.result())
+
+        def worker():
+            buff = collections.deque()
             iterable = (
                 self._iterable.chunks()
                 if isinstance(self._iterable, ChunkedTable)
@@ -285,17 +313,15 @@ class ParallelMixin:
             )
             for x in iterable:
                 if len(buff) == num_worker:
-                    queue.put(await buff.pop(0))
-                buff.append(loop.run_in_executor(executor, self._map_task(x, unary_op)))
+                    put_next(buff)
+                buff.append(executor.submit(self._map_task(x, unary_op, apply)))
             while len(buff) > 0:
-                queue.put(await buff.pop(0))
+                put_next(buff)
             queue.put(EOS())
+            if owned:
+                executor.shutdown(wait=False)
 
-        def worker_wrapper():
-            loop.run_until_complete(worker())
-            loop.close()
-
-        t = threading.Thread(target=worker_wrapper, daemon=True)
+        t = threading.Thread(target=worker, daemon=True)
         t.start()
 
         res = inner()
@@ -38,7 +38,7 @@ class StateMixin:
 
     def __init__(self):
         super().__init__()
-        parent = param_scope.data_collection.parent | None
+        parent = self._parent
         if parent is not None:
             self.set_state(parent.get_state())
 
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import functools
 from typing import Any, Callable
 
 from hyperparameter import param_scope
@@ -66,23 +67,54 @@ class DynamicDispatch:
     def __getattr__(self, name: str) -> Any:
         if self._name is not None:
             name = "{}.{}".format(self._name, name)
-        return dynamic_dispatch(self._func, name, self._index)
+        return type(self)(self._func, name, self._index)
 
     def __getitem__(self, index):
-        return dynamic_dispatch(self._func, self._name, index)
+        return type(self)(self._func, self._name, index)
 
+    def _resolve_child(self, name: str, index=None):
+        """Return the dispatcher for `self.<name>[index]`, memoized per key.
 
-def dynamic_dispatch(func, name=None, index=None):
-    """Wraps function with a class to allow __getitem__ and __getattr__ on a function."""
-    new_class = type(
-        func.__name__,
+        >>> @dynamic_dispatch
+        ... def f(): pass
+        >>> f._resolve_child("a.b", 1) is f._resolve_child("a.b", 1)
+        True
+        >>> f._resolve_child("a.b", 1)._name
+        'a.b'
+        """
+        try:
+            return _child_dispatch(self, name, index)
+        except TypeError:  # unhashable index
+            return getattr(self, name)[index]
+
+
+@functools.lru_cache(maxsize=256)
+def _child_dispatch(parent, name, index):
+    return getattr(parent, name)[index]
+
+
+@functools.lru_cache(maxsize=None)
+def _dispatch_class(name, doc):
+    return type(
+        name,
         (
             DynamicDispatch,
             object,
         ),
-        dict(__doc__=func.__doc__),
+        dict(__doc__=doc),
     )
-    return new_class(func, name, index)
+
+
+def dynamic_dispatch(func, name=None, index=None):
+    """Wraps function with a class to allow __getitem__ and __getattr__ on a function.
+
+    The wrapper class is created once per function name and docstring:
+
+    >>> def f(): pass
+    >>> type(dynamic_dispatch(f)) is type(dynamic_dispatch(f).a[1])
+    True
+    """
+    return _dispatch_class(func.__name__, func.__doc__)(func, name, index)
 
 
 __all__ = [
@@ -95,5 +127,6 @@ __all__ = [
     "Option",
     "Entity",
     "EntityView",
+    "DynamicDispatch",
     "dynamic_dispatch",
 ]
@@ -1,6 +1,16 @@
+import functools
 from typing import Any
 
 
+@functools.lru_cache(maxsize=1024)
+def _split_path(name):
+    """Split a dotted field name into `(parents, leaf)`, or None if not dotted."""
+    if "." not in name:
+        return None
+    *parents, leaf = name.split(".")
+    return tuple(parents), leaf
+
+
 class Document(dict):
     """Data type for json document
 
@@ -25,6 +35,12 @@ class Document(dict):
         {'c': 2}
         >>> getattr(doc, "b.c")
         2
+
+        >>> setattr(doc, "x.y.z", 3)
+        >>> getattr(doc, "x.y.z")
+        3
+        >>> doc["x"]
+        {'y': {'z': 3}}
     """
 
     def __init__(self, **kwargs):
@@ -32,19 +48,25 @@ class Document(dict):
             setattr(self, k, v)
 
     def __getattr__(self, name):
-        if "." in name:
-            head, tail = name.split(".", 1)
-            return getattr(self[head], tail)
+        path = _split_path(name)
+        if path is not None:
+            obj = self
+            for head in path[0]:
+                obj = obj[head]
+            return getattr(obj, path[1])
         if name in self:
             return self[name]
         return None
 
     def __setattr__(self, name: str, value: Any) -> None:
-        if "." in name:
-            head, tail = name.split(".", 1)
-            if not head in self:
-                self[head] = Document()
-            setattr(self[head], tail, value)
+        path = _split_path(name)
+        if path is not None:
+            obj = self
+            for head in path[0]:
+                if head not in obj:
+                    obj[head] = Document()
+                obj = obj[head]
+            setattr(obj, path[1], value)
             return self
         if isinstance(value, dict):
             self[name] = Document(**value)
@@ -72,6 +72,27 @@ class Entity:
         """
         return cls(**tar)
 
+    @classmethod
+    def from_pairs(cls, keys, values):
+        """
+        Create an Entity from parallel sequences of keys and values.
+
+        Args:
+            keys (`Iterable[str]`):
+                The attribute names.
+            values (`Iterable[Any]`):
+                The attribute values, in the same order as `keys`.
+
+        Examples:
+
+            >>> from reactive import Entity
+            >>> str(Entity.from_pairs(('a', 'b'), (1, 2)))
+            "{'a': 1, 'b': 2}"
+        """
+        entity = cls.__new__(cls)
+        entity.__dict__.update(zip(keys, values))
+        return entity
+
 
 class EntityView:
     """
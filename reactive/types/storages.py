@@ -47,18 +47,10 @@ class WritableTable:
 
     def seal(self):
         # pylint: disable=protected-access
-        import pyarrow as pa
-
-        from reactive.types.tensor_array import TensorArray
+        from reactive.types.tensor_array import arrow_array
 
         names = list(self._buffer)
-        arrays = []
-        for name in names:
-            try:
-                arrays.append(pa.array(self._buffer[name]))
-            # pylint: disable=bare-except
-            except:
-                arrays.append(TensorArray.from_numpy(self._buffer[name]))
+        arrays = [arrow_array(self._buffer[name]) for name in names]
         new_table = self._table
         for name, arr in zip(names, arrays):
             new_table = new_table.append_column(name, arr)
@@ -72,6 +64,9 @@ class WritableTable:
     def __len__(self):
         return self._table.num_rows
 
+    def to_arrow(self):
+        return self._table
+
     def __getattr__(self, name):
         if name in self._table.column_names:
             return self._table.__getitem__(name)
@@ -120,10 +115,19 @@ class ChunkedTable:
     def chunks(self):
         return self._chunks
 
+    def to_arrow(self):
+        """
+        Concatenate the chunks into a single arrow table without copying.
+        """
+        import pyarrow as pa
+
+        # pylint: disable=protected-access
+        return pa.concat_tables(chunk._table for chunk in self._chunks)
+
     def _create_table(self, chunk, head):
         import pyarrow as pa
 
-        from reactive.types.tensor_array import TensorArray
+        from reactive.types.tensor_array import arrow_array
 
         # head = []
         cols = None
@@ -131,13 +135,7 @@ class ChunkedTable:
             cols = [[] for _ in head] if cols is None else cols
             for col, name in zip(cols, head):
                 col.append(getattr(entity, name))
-        arrays = []
-        for col in cols:
-            try:
-                arrays.append(pa.array(col))
-            # pylint: disable=bare-except
-            except:
-                arrays.append(TensorArray.from_numpy(col))
+        arrays = [arrow_array(col) for col in cols]
 
         res = pa.Table.from_arrays(arrays, names=head)
 
@@ -113,3 +113,26 @@ class TensorArray(pa.ExtensionArray):
 
     def __iter__(self):
         return (self[i] for i in range(len(self)))
+
+
+def arrow_array(values):
+    """Convert a column of values to an arrow array.
+
+    Multi-dimensional arrays, which arrow cannot infer, are stored as tensors.
+
+    Examples:
+
+    >>> arrow_array([1, 2, 3]).type
+    DataType(int64)
+    >>> arrow_array([np.arange(2), np.arange(2)]).type
+    ListType(list<item: int64>)
+    >>> type(arrow_array([np.zeros([2, 2]), np.ones([2, 2])]))
+    <class 'reactive.types.tensor_array.TensorArray'>
+    """
+    if isinstance(values, (list, tuple)):
+        tensor = bool(values) and getattr(values[0], "ndim", 0) > 1
+    else:
+        tensor = getattr(values, "ndim", 0) > 1
+    if tensor:
+        return TensorArray.from_numpy(values)
+    return pa.array(values)
@@ -1,4 +1,5 @@
 import doctest
+import functools
 import unittest
 from pathlib import Path
 
@@ -84,7 +85,11 @@ class TestColumnComputing(unittest.TestCase):
     """
 
     def test_siso(self):
-        df = rv.of["a"](range(10)).to_column().runas_op["a", "b"](func=lambda x: x + 1)
+        df = (
+            rv.of["a"](range(10))
+            .to_column()
+            .runas_op["a", "b"](func=functools.partial(np.add, 1))
+        )
 
         self.assertTrue(all(map(lambda x: x.a == x.b - 1, df)))
 
@@ -102,7 +107,7 @@ class TestColumnComputing(unittest.TestCase):
         df = (
             rv.of["a", "b"]([range(10), range(10)])
             .to_column()
-            .runas_op[("a", "b"), "c"](func=lambda x, y: x + y)
+            .runas_op[("a", "b"), "c"](func=np.add)
         )
 
         self.assertTrue(all(map(lambda x: x.c == x.a + x.b, df)))
@@ -116,6 +121,43 @@ class TestColumnComputing(unittest.TestCase):
 
         self.assertTrue(all(map(lambda x: x.a == x.c - 1 and x.b == x.d + 1, df)))
 
+    def test_rowwise_fallback(self):
+        df = (
+            rv.of["a"](["x", "y"])
+            .to_column()
+            .runas_op["a", "b"](func=lambda x: x.upper())
+        )
+        self.assertEqual([x.b for x in df], ["X", "Y"])
+
+        df = (
+            rv.of["a"](range(10))
+            .to_column()
+            .runas_op["a", "b"](func=lambda x: x - x.mean())
+        )
+        self.assertTrue(all(map(lambda x: x.b == 0, df)))
+
+        df = (
+            rv.of["a"]([5, 0, 10, 5])
+            .to_column()
+            .runas_op["a", "b"](func=lambda x: x - x.mean())
+        )
+        self.assertEqual([x.b for x in df], [0, 0, 0, 0])
+
+    def test_vectorized(self):
+        calls = []
+
+        def add_one(x):
+            calls.append(x)
+            return x + 1
+
+        df = (
+            rv.of["a"](range(10))
+            .to_column()
+            .runas_op["a", "b"](func=add_one, vectorized=True)
+        )
+        self.assertEqual(len(calls), 1)
+        self.assertTrue(all(map(lambda x: x.a == x.b - 1, df)))
+
 
 class TestCompileMixin(unittest.TestCase):
     """
@@ -129,25 +171,20 @@ class TestCompileMixin(unittest.TestCase):
 
         @register(name="inner_distance")
         def inner_distance(query, data):
-            dists = []
-            for vec in data:
-                dist = 0
-                for i in range(len(vec)):
-                    dist += vec[i] * query[i]
-                dists.append(dist)
-            return dists
+            # One BLAS matrix-vector product, under numba as well as in python.
+            return data @ query
 
-        data = [np.random.random((10000, 128)) for _ in range(10)]
-        query = np.random.random(128)
+        data = [np.random.random((10000, 128)).astype(np.float32) for _ in range(10)]
+        query = np.random.random(128).astype(np.float32)
 
         t1 = time.time()
-        _ = (
+        res = (
             rv.of["a"](data)
             .runas_op["a", "b"](func=lambda _: query)
             .inner_distance[("b", "a"), "c"]()
         )
         t2 = time.time()
-        _ = (
+        jit_res = (
             rv.of["a"](data)
             .config(jit="numba")
             .runas_op["a", "b"](func=lambda _: query)
@@ -156,6 +193,10 @@ class TestCompileMixin(unittest.TestCase):
         t3 = time.time()
         # self.assertTrue(t3 - t2 < t2 - t1)
 
+        for x, y in zip(res, jit_res):
+            np.testing.assert_allclose(x.c, x.a @ query, rtol=1e-5)
+            np.testing.assert_allclose(y.c, x.c, rtol=1e-5)
+
     def test_failed_compile(self):
         from reactive import register
 
@@ -163,9 +204,10 @@ class TestCompileMixin(unittest.TestCase):
         def inner_distance1(query, data):
             data = np.array(data)  # numba does not support np.array(data)
             dists = []
+            n = query.shape[0]
             for vec in data:
-                dist = 0
-                for i in range(len(vec)):
+                dist = 0.0
+                for i in range(n):
                     dist += vec[i] * query[i]
                 dists.append(dist)
             return dists
@@ -180,6 +222,17 @@ class TestCompileMixin(unittest.TestCase):
             .inner_distance1[("b", "a"), "c"]()
         )
 
+    def test_compile_column(self):
+        from reactive import register
+
+        @register(name="scale_add")
+        def scale_add(x):
+            return x * 2 + 1
+
+        dc = rv.of["a"](range(100)).set_chunksize(30).config(jit="numba")
+        res = dc.scale_add["a", "b"]()
+        self.assertEqual([e.b for e in res], [x * 2 + 1 for x in range(100)])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -43,6 +43,14 @@ class TestParallel(unittest.TestCase):
             .to_list()
         )
 
+    def test_nested_pmap(self):
+        res = (
+            rv.range(4)
+            .pmap(lambda x: sum(rv.range(3).pmap(lambda y: y + x, 2).to_list()), 2)
+            .to_list()
+        )
+        self.assertEqual(res, [3, 6, 9, 12])
+
 
 def load_tests(loader, tests, ignore):
     # pylint: disable=unused-argument